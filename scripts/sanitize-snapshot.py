@@ -6,8 +6,14 @@ Replaces real names, emails, and student numbers with fake data.
 
 import json
 import random
+import re
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser when orjson isn't installed
+    orjson = None
+
 # Fake first and last names for generating student names
 FIRST_NAMES = [
     "Alice", "Bob", "Charlie", "Diana", "Emma", "Frank", "Grace", "Henry",
@@ -35,246 +41,372 @@ LAST_NAMES = [
     "Bennett", "Watson", "Jenkins", "Perry", "Powell", "Long", "Patterson", "Hughes"
 ]
 
+# Student emails are a student number at the school board domain
+STUDENT_EMAIL_RE = re.compile(r"(\d+)@gapps\.yrdsb\.ca")
+
+# Google URL patterns, one group per placeholder in URL_PLACEHOLDERS
+GOOGLE_URL_RE = re.compile(
+    r"(classroom\.google\.com)"
+    r"|(docs\.google\.com/forms)"
+    r"|(docs\.google\.com/spreadsheets)"
+    r"|(googleusercontent\.com|^//lh)"
+)
+URL_PLACEHOLDERS = (
+    "https://classroom.example.com/placeholder",
+    "https://forms.example.com/placeholder",
+    "https://sheets.example.com/placeholder",
+    "https://cdn.example.com/placeholder.png",
+)
+
+# Required quizData fields and their defaults; callables compute the value
+# from the quiz data and the anonymizer's random generator
+QUIZ_DEFAULTS = (
+    ("formId", lambda quiz_data, rng: f"quiz_form_{rng.randint(100000, 999999)}"),
+    ("formUrl", "https://forms.example.com/placeholder"),
+    ("title", "Sample Quiz"),
+    ("isQuiz", True),
+    ("collectEmailAddresses", True),
+    ("allowResponseEditing", False),
+    ("totalQuestions", lambda quiz_data, rng: len(quiz_data.get("questions", []))),
+    ("totalPoints", 100),
+    ("autoGradableQuestions", 0),
+    ("manualGradingRequired", True),
+    ("requireSignIn", True),
+)
+
 def reverse_student_number(student_number):
     """Reverse a student number string."""
     return student_number[::-1]
 
-def generate_fake_name(index, used_names):
+def generate_fake_name(index):
     """Generate a unique fake name."""
-    attempts = 0
-    while attempts < 100:
-        first = FIRST_NAMES[index % len(FIRST_NAMES)]
-        last = LAST_NAMES[(index + attempts) % len(LAST_NAMES)]
-        name = f"{first} {last}"
-        if name not in used_names:
-            used_names.add(name)
-            return name
-        attempts += 1
+    # Every block of FIRST_NAMES pairs shifts the last name by one more place,
+    # so the first len(FIRST_NAMES) * len(LAST_NAMES) indices never repeat
+    block, position = divmod(index, len(FIRST_NAMES))
+    first = FIRST_NAMES[position]
+    last = LAST_NAMES[(position + block) % len(LAST_NAMES)]
+    rollover = index // (len(FIRST_NAMES) * len(LAST_NAMES))
     # Fallback: add number suffix
-    return f"{first} {last}{index}"
+    return f"{first} {last}{rollover}" if rollover else f"{first} {last}"
 
-def anonymize_json(data):
-    """Anonymize the classroom snapshot JSON data."""
+def generate_fake_student_id(student_id, rng=random):
+    """Generate a random numeric student ID of the same length."""
+    # One RNG call for the whole ID, zero-padded to keep leading zeros
+    length = len(student_id)
+    if not length:
+        return ""
+    return f"{rng.randrange(10 ** length):0{length}d}"
+
+class AnonymizerContext:
+    """Mappings and pending work for a single anonymization run."""
     
-    # Track mappings for consistency
-    name_mapping = {}
-    student_number_mapping = {}
-    student_id_mapping = {}
-    used_names = set()
+    __slots__ = (
+        "rng", "in_place", "name_mapping", "student_number_mapping", "student_email_mapping",
+        "student_id_mapping", "pending_names", "pending_texts", "stack",
+    )
     
-    # Pre-populate teacher mapping
-    name_mapping["Stewart Chan"] = "Teacher Demo"
-    name_mapping["Test Teacher"] = "Teacher Demo"  # Handle already anonymized
-    name_mapping["Dev CodePet"] = "Teacher Demo"  # Handle already anonymized
+    def __init__(self, seed=None, in_place=False):
+        self.rng = random.Random(seed)
+        # Rewrite the input containers instead of building a copy of the tree
+        self.in_place = in_place
+        
+        # Track mappings for consistency
+        self.name_mapping = {}
+        self.student_number_mapping = {}
+        self.student_email_mapping = {}
+        self.student_id_mapping = {}
+        
+        # Pre-populate teacher mapping
+        self.name_mapping["Stewart Chan"] = "Teacher Demo"
+        self.name_mapping["Test Teacher"] = "Teacher Demo"  # Handle already anonymized
+        self.name_mapping["Dev CodePet"] = "Teacher Demo"  # Handle already anonymized
+        
+        # Values that can only be finalized once every identifier has been seen
+        self.pending_names = []
+        self.pending_texts = []
+        
+        # Work stack of (source, target) containers still to be filled in
+        self.stack = []
+
+def get_or_create_mapping(mapping, key, factory):
+    """Return the mapped value for key, creating it on first sight."""
+    if key not in mapping:
+        mapping[key] = factory(key)
+    return mapping[key]
+
+def register_student(ctx, name, email):
+    """Record the name and student number behind a student email."""
+    # Check if it's a student email (9-digit@gapps.yrdsb.ca)
+    match = STUDENT_EMAIL_RE.match(email) if isinstance(email, str) else None
+    if match:
+        student_number = match.group(1)
+        name_mapping = ctx.name_mapping
+        if name is not None and name != "Stewart Chan":
+            get_or_create_mapping(name_mapping, name, lambda _: generate_fake_name(len(name_mapping)))
+        # Always map student number (even if name was already mapped)
+        get_or_create_mapping(ctx.student_number_mapping, student_number, reverse_student_number)
+
+def register_identifiers(ctx, obj):
+    """Collect identifiers from a single dict before its keys are replaced."""
+    # Collect student data
+    if "name" in obj and "email" in obj:
+        register_student(ctx, obj["name"], obj["email"])
+    # Also collect student emails without associated names
+    elif "email" in obj:
+        register_student(ctx, None, obj["email"])
     
-    # First pass: collect all unique names and student numbers
-    def collect_identifiers(obj):
-        if isinstance(obj, dict):
-            # Collect teacher name
-            if obj.get("email") == "stewart.chan@gapps.yrdsb.ca":
-                name_mapping["Stewart Chan"] = "Teacher Demo"
-            
-            # Collect student data
-            if "name" in obj and "email" in obj:
-                email = obj["email"]
-                name = obj["name"]
-                
-                # Check if it's a student email (9-digit@gapps.yrdsb.ca)
-                if "@gapps.yrdsb.ca" in email and email.split("@")[0].isdigit():
-                    student_number = email.split("@")[0]
-                    if name not in name_mapping and name != "Stewart Chan":
-                        # Generate fake name
-                        fake_name = generate_fake_name(len(name_mapping), used_names)
-                        name_mapping[name] = fake_name
-                    
-                    # Always map student number (even if name was already mapped)
-                    if student_number not in student_number_mapping:
-                        reversed_number = reverse_student_number(student_number)
-                        student_number_mapping[student_number] = reversed_number
-            
-            # Collect submission-level student data (new fields)
-            if "studentEmail" in obj and "studentName" in obj:
-                email = obj["studentEmail"]
-                name = obj["studentName"]
-                
-                # Check if it's a student email (9-digit@gapps.yrdsb.ca)
-                if "@gapps.yrdsb.ca" in email and email.split("@")[0].isdigit():
-                    student_number = email.split("@")[0]
-                    if name not in name_mapping and name != "Stewart Chan":
-                        # Generate fake name
-                        fake_name = generate_fake_name(len(name_mapping), used_names)
-                        name_mapping[name] = fake_name
-                    
-                    # Always map student number (even if name was already mapped)
-                    if student_number not in student_number_mapping:
-                        reversed_number = reverse_student_number(student_number)
-                        student_number_mapping[student_number] = reversed_number
-            
-            # Also collect student emails without associated names
-            if "email" in obj:
-                email = obj["email"]
-                if "@gapps.yrdsb.ca" in email and email.split("@")[0].isdigit():
-                    student_number = email.split("@")[0]
-                    if student_number not in student_number_mapping:
-                        reversed_number = reverse_student_number(student_number)
-                        student_number_mapping[student_number] = reversed_number
-            
-            # Collect student IDs
-            if "studentId" in obj:
-                student_id = obj["studentId"]
-                if student_id not in student_id_mapping:
-                    # Generate a fake student ID (keep same length)
-                    fake_id = ''.join(random.choices('0123456789', k=len(student_id)))
-                    student_id_mapping[student_id] = fake_id
-            
-            for value in obj.values():
-                collect_identifiers(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                collect_identifiers(item)
+    # Collect submission-level student data (new fields)
+    if "studentEmail" in obj and "studentName" in obj:
+        register_student(ctx, obj["studentName"], obj["studentEmail"])
     
-    collect_identifiers(data)
+    # Collect student IDs
+    if "studentId" in obj:
+        rng = ctx.rng
+        get_or_create_mapping(
+            ctx.student_id_mapping, obj["studentId"],
+            lambda student_id: generate_fake_student_id(student_id, rng)
+        )
+
+def writable(ctx, obj):
+    """Return a dict or list that can be modified for the output."""
+    return obj if ctx.in_place else obj.copy()
+
+# Replacement handlers: each writes the anonymized value into parent[key]
+def copy_value(ctx, parent, key, value):
+    # Nested objects get a shallow copy now, so plain leaves are already in
+    # place; only handled keys and nested containers are revisited from the stack
+    if isinstance(value, (dict, list)):
+        parent[key] = writable(ctx, value)
+        ctx.stack.append((value, parent[key]))
+    else:
+        parent[key] = value
+
+def replace_teacher_email(ctx, parent, key, value):
+    # Replace teacher email (including teacherEmail, teacherId fields)
+    if value == "stewart.chan@gapps.yrdsb.ca":
+        parent[key] = "teacher@schoolemail.com"
+    else:
+        copy_value(ctx, parent, key, value)
+
+def replace_student_email(ctx, parent, key, value):
+    # Replace student emails (only reverse if it's a student number)
+    match = STUDENT_EMAIL_RE.match(value) if isinstance(value, str) else None
+    if match:
+        # Build each anonymized email once per unique student number
+        parent[key] = get_or_create_mapping(
+            ctx.student_email_mapping, match.group(1),
+            lambda student_number: f"{reverse_student_number(student_number)}@gapps.yrdsb.ca"
+        )
+    else:
+        copy_value(ctx, parent, key, value)
+
+def replace_email(ctx, parent, key, value):
+    if value == "stewart.chan@gapps.yrdsb.ca":
+        parent[key] = "teacher@schoolemail.com"
+    else:
+        replace_student_email(ctx, parent, key, value)
+
+def replace_name(ctx, parent, key, value):
+    # Replace names
+    if not isinstance(value, str):
+        copy_value(ctx, parent, key, value)
+    elif value in ctx.name_mapping:
+        parent[key] = ctx.name_mapping[value]
+    else:
+        # The owning student may not have been seen yet
+        parent[key] = value
+        ctx.pending_names.append((parent, key))
+
+def replace_student_id(ctx, parent, key, value):
+    # Replace student IDs
+    if value in ctx.student_id_mapping:
+        parent[key] = ctx.student_id_mapping[value]
+    else:
+        copy_value(ctx, parent, key, value)
+
+def replace_url(ctx, parent, key, value):
+    # Replace Google URLs with placeholders; only non-strings need str(), which
+    # still catches URLs nested in an unexpected list or dict value
+    match = GOOGLE_URL_RE.search(value if type(value) is str else str(value))
+    parent[key] = URL_PLACEHOLDERS[match.lastindex - 1] if match else value
+
+def replace_quiz_data(ctx, parent, key, value):
+    # Fix incomplete quiz data
+    if not isinstance(value, dict):
+        copy_value(ctx, parent, key, value)
+        return
+    # Add required fields if missing, copying only when something is added
+    missing = [(field, default) for field, default in QUIZ_DEFAULTS if field not in value]
+    if not missing:
+        parent[key] = value
+        return
+    quiz_data = writable(ctx, value)
+    for field, default in missing:
+        quiz_data[field] = default(quiz_data, ctx.rng) if callable(default) else default
+    parent[key] = quiz_data
+
+def replace_course_group_email(ctx, parent, key, value):
+    # Replace course group emails (the board domain is always the suffix)
+    if value.endswith("@gapps.yrdsb.ca"):
+        parent[key] = value[:-len("@gapps.yrdsb.ca")] + "@example.com"
+    else:
+        parent[key] = value
+
+def replace_extracted_content(ctx, parent, key, value):
+    # Handle extractedContent field - anonymize text and structured data
+    if not isinstance(value, dict):
+        copy_value(ctx, parent, key, value)
+        return
+    extracted_content = writable(ctx, value)
+    
+    # Anonymize text content once all names are known
+    if "text" in extracted_content and isinstance(extracted_content["text"], str):
+        ctx.pending_texts.append(extracted_content)
     
-    # Second pass: apply replacements
-    def replace_identifiers(obj):
-        if isinstance(obj, dict):
-            new_obj = {}
-            for key, value in obj.items():
-                # Replace teacher email (including teacherEmail, teacherId fields)
-                if key in ["email", "teacherEmail", "teacherId"] and value == "stewart.chan@gapps.yrdsb.ca":
-                    new_obj[key] = "teacher@schoolemail.com"
-                # Replace student emails
-                elif key in ["email", "studentEmail"] and "@gapps.yrdsb.ca" in str(value):
-                    student_number = value.split("@")[0]
-                    if student_number.isdigit():  # Only reverse if it's a student number
-                        if student_number in student_number_mapping:
-                            new_obj[key] = f"{student_number_mapping[student_number]}@gapps.yrdsb.ca"
-                        else:
-                            # Reverse it on the fly if not in mapping
-                            reversed_number = reverse_student_number(student_number)
-                            new_obj[key] = f"{reversed_number}@gapps.yrdsb.ca"
-                    else:
-                        new_obj[key] = value
-                # Replace names
-                elif key in ["name", "displayName", "studentName"] and isinstance(value, str) and value in name_mapping:
-                    new_obj[key] = name_mapping[value]
-                # Replace student IDs
-                elif key == "studentId" and value in student_id_mapping:
-                    new_obj[key] = student_id_mapping[value]
-                # Replace Google URLs with placeholders
-                elif key in ["alternateLink", "formUrl", "responseUrl", "thumbnailUrl", "photoUrl"]:
-                    if "classroom.google.com" in str(value):
-                        new_obj[key] = "https://classroom.example.com/placeholder"
-                    elif "docs.google.com/forms" in str(value):
-                        new_obj[key] = "https://forms.example.com/placeholder"
-                    elif "docs.google.com/spreadsheets" in str(value):
-                        new_obj[key] = "https://sheets.example.com/placeholder"
-                    elif "googleusercontent.com" in str(value) or str(value).startswith("//lh"):
-                        new_obj[key] = "https://cdn.example.com/placeholder.png"
-                    else:
-                        new_obj[key] = value
-                # Fix incomplete quiz data
-                elif key == "quizData" and isinstance(value, dict):
-                    quiz_data = dict(value)
-                    # Add required fields if missing
-                    if "formId" not in quiz_data:
-                        quiz_data["formId"] = f"quiz_form_{random.randint(100000, 999999)}"
-                    if "formUrl" not in quiz_data:
-                        quiz_data["formUrl"] = "https://forms.example.com/placeholder"
-                    if "title" not in quiz_data:
-                        quiz_data["title"] = "Sample Quiz"
-                    if "isQuiz" not in quiz_data:
-                        quiz_data["isQuiz"] = True
-                    if "collectEmailAddresses" not in quiz_data:
-                        quiz_data["collectEmailAddresses"] = True
-                    if "allowResponseEditing" not in quiz_data:
-                        quiz_data["allowResponseEditing"] = False
-                    if "totalQuestions" not in quiz_data:
-                        quiz_data["totalQuestions"] = len(quiz_data.get("questions", []))
-                    if "totalPoints" not in quiz_data:
-                        quiz_data["totalPoints"] = 100
-                    if "autoGradableQuestions" not in quiz_data:
-                        quiz_data["autoGradableQuestions"] = 0
-                    if "manualGradingRequired" not in quiz_data:
-                        quiz_data["manualGradingRequired"] = True
-                    if "requireSignIn" not in quiz_data:
-                        quiz_data["requireSignIn"] = True
-                    new_obj[key] = quiz_data
-                # Replace course group emails
-                elif key == "courseGroupEmail":
-                    new_obj[key] = value.replace("@gapps.yrdsb.ca", "@example.com")
-                # Handle extractedContent field - anonymize text and structured data
-                elif key == "extractedContent" and isinstance(value, dict):
-                    extracted_content = dict(value)
-                    
-                    # Anonymize text content
-                    if "text" in extracted_content and isinstance(extracted_content["text"], str):
-                        text = extracted_content["text"]
-                        # Replace names in extracted text
-                        for original_name, fake_name in name_mapping.items():
-                            text = text.replace(original_name, fake_name)
-                        # Replace email addresses in text
-                        for student_number, reversed_number in student_number_mapping.items():
-                            text = text.replace(f"{student_number}@gapps.yrdsb.ca", f"{reversed_number}@gapps.yrdsb.ca")
-                        extracted_content["text"] = text
-                    
-                    # Anonymize structured data (recursively)
-                    if "structuredData" in extracted_content:
-                        extracted_content["structuredData"] = replace_identifiers(extracted_content["structuredData"])
-                    
-                    # Process other nested fields
-                    for field in ["images", "metadata"]:
-                        if field in extracted_content:
-                            extracted_content[field] = replace_identifiers(extracted_content[field])
-                    
-                    new_obj[key] = extracted_content
-                # Handle aiProcessingStatus field - keep structure but clean timestamps
-                elif key == "aiProcessingStatus" and isinstance(value, dict):
-                    ai_status = dict(value)
-                    # Normalize timestamps for consistency
-                    if "lastProcessedAt" in ai_status:
-                        ai_status["lastProcessedAt"] = "2025-01-15T12:00:00.000Z"
-                    new_obj[key] = ai_status
-                # Recursively process nested objects
-                elif isinstance(value, (dict, list)):
-                    new_obj[key] = replace_identifiers(value)
-                else:
-                    new_obj[key] = value
-            
-            # Add missing required fields for submissions
-            if "studentEmail" in new_obj and "studentName" in new_obj:
+    # Anonymize structured data and other nested fields
+    for field in ["structuredData", "images", "metadata"]:
+        if field in extracted_content:
+            copy_value(ctx, extracted_content, field, extracted_content[field])
+    
+    parent[key] = extracted_content
+
+def replace_ai_processing_status(ctx, parent, key, value):
+    # Handle aiProcessingStatus field - keep structure but clean timestamps
+    if not isinstance(value, dict):
+        copy_value(ctx, parent, key, value)
+        return
+    ai_status = writable(ctx, value)
+    # Normalize timestamps for consistency
+    if "lastProcessedAt" in ai_status:
+        ai_status["lastProcessedAt"] = "2025-01-15T12:00:00.000Z"
+    parent[key] = ai_status
+
+# Dispatch table: one dict lookup per key instead of an if/elif ladder
+HANDLERS = {
+    "email": replace_email,
+    "teacherEmail": replace_teacher_email,
+    "teacherId": replace_teacher_email,
+    "studentEmail": replace_student_email,
+    "name": replace_name,
+    "displayName": replace_name,
+    "studentName": replace_name,
+    "studentId": replace_student_id,
+    "alternateLink": replace_url,
+    "formUrl": replace_url,
+    "responseUrl": replace_url,
+    "thumbnailUrl": replace_url,
+    "photoUrl": replace_url,
+    "quizData": replace_quiz_data,
+    "courseGroupEmail": replace_course_group_email,
+    "extractedContent": replace_extracted_content,
+    "aiProcessingStatus": replace_ai_processing_status,
+}
+
+def finalize_submission(new_obj):
+    """Add missing required fields for submissions."""
+    if "updatedAt" not in new_obj:
+        new_obj["updatedAt"] = new_obj.get("submittedAt", "2025-01-15T12:00:00.000Z")
+    if "attachments" not in new_obj:
+        new_obj["attachments"] = []
+    # Fix grade.gradedBy if present
+    if "grade" in new_obj and isinstance(new_obj["grade"], dict):
+        if new_obj["grade"].get("gradedBy") == "teacher":
+            new_obj["grade"]["gradedBy"] = "manual"
+
+def replace_identifiers(ctx, obj):
+    """Single pass: collect identifiers and apply replacements."""
+    stack = ctx.stack
+    # Bind hot-loop lookups to locals once instead of per node
+    pop = stack.pop
+    get_handler = HANDLERS.get
+    containers = (dict, list)
+    root = [None]
+    copy_value(ctx, root, 0, obj)
+    while stack:
+        source, target = pop()
+        if source is None:
+            # All children are filled in, so the submission can be completed
+            finalize_submission(target)
+            continue
+        if isinstance(source, dict):
+            register_identifiers(ctx, source)
+            if "studentEmail" in source and "studentName" in source:
                 # This looks like a submission object, ensure required fields exist
-                if "updatedAt" not in new_obj:
-                    new_obj["updatedAt"] = new_obj.get("submittedAt", "2025-01-15T12:00:00.000Z")
-                if "attachments" not in new_obj:
-                    new_obj["attachments"] = []
-                # Fix grade.gradedBy if present
-                if "grade" in new_obj and isinstance(new_obj["grade"], dict):
-                    if new_obj["grade"].get("gradedBy") == "teacher":
-                        new_obj["grade"]["gradedBy"] = "manual"
-                    
-            return new_obj
-        elif isinstance(obj, list):
-            return [replace_identifiers(item) for item in obj]
+                stack.append((None, target))
+            mark = len(stack)
+            for key, value in source.items():
+                handler = get_handler(key)
+                if handler is not None:
+                    handler(ctx, target, key, value)
+                elif isinstance(value, containers):
+                    copy_value(ctx, target, key, value)
         else:
-            return obj
+            mark = len(stack)
+            for index, item in enumerate(source):
+                if isinstance(item, containers):
+                    copy_value(ctx, target, index, item)
+        # Pop children in document order so identifiers are collected as before
+        stack[mark:] = reversed(stack[mark:])
+    return root[0]
+
+def anonymize_json(data, seed=None, in_place=False):
+    """Anonymize the classroom snapshot JSON data.
+
+    Pass a seed to make the generated student and form IDs reproducible, and
+    in_place=True to rewrite data itself when the original isn't needed.
+    """
+    ctx = AnonymizerContext(seed, in_place)
+    result = replace_identifiers(ctx, data)
+    
+    # Resolve names that appeared before their student was collected
+    for new_obj, key in ctx.pending_names:
+        value = new_obj[key]
+        if value in ctx.name_mapping:
+            new_obj[key] = ctx.name_mapping[value]
     
-    return replace_identifiers(data)
+    # Build the text substitutions once rather than per extracted text
+    text_replacements = list(ctx.name_mapping.items())
+    # Replace email addresses in text
+    text_replacements += [
+        (f"{student_number}@gapps.yrdsb.ca", f"{reversed_number}@gapps.yrdsb.ca")
+        for student_number, reversed_number in ctx.student_number_mapping.items()
+    ]
+    for extracted_content in ctx.pending_texts:
+        text = extracted_content["text"]
+        for original, replacement in text_replacements:
+            text = text.replace(original, replacement)
+        extracted_content["text"] = text
+    
+    return result
+
+def load_snapshot(path):
+    """Read and parse a snapshot JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_snapshot(data, path):
+    """Serialize snapshot data to a JSON file with 2-space indentation."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
 
 def main():
     source_file = Path("/Users/stew/Repos/vibe/roo/frontend/e2e/fixtures/classroom-snapshot-stewart.chan-2025-08-27.json")
     output_file = Path("/Users/stew/Repos/vibe/roo/frontend/e2e/fixtures/classroom-snapshot-mock.json")
     
     print(f"Reading {source_file}...")
-    with open(source_file, 'r') as f:
-        data = json.load(f)
+    data = load_snapshot(source_file)
     
     print("Anonymizing data...")
-    anonymized_data = anonymize_json(data)
+    # The source tree is discarded, so rewrite it rather than copying it
+    anonymized_data = anonymize_json(data, in_place=True)
     
     print(f"Writing anonymized data to {output_file}...")
-    with open(output_file, 'w') as f:
-        json.dump(anonymized_data, f, indent=2)
+    write_snapshot(anonymized_data, output_file)
     
     print("✅ Anonymization complete!")
     print(f"Fresh anonymized test data is now available in {output_file}")